@@ -1,10 +1,28 @@
 """
 See YouTube tutorial here: https://youtu.be/Is8Qu7onvzM
 """
+import os
 import random
 import time
 
+import bmesh
 import bpy
+import mathutils
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, without it the numeric kernels run as regular numpy code
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# numba can only cache compiled kernels when this script is a file on disk (not an unsaved text block)
+NUMBA_CACHE = os.path.isfile(__file__)
 
 
 ################################################################
@@ -44,26 +62,18 @@ def clean_scene():
     if bpy.context.active_object and bpy.context.active_object.mode == "EDIT":
         bpy.ops.object.editmode_toggle()
 
-    # make sure non of the objects are hidden from the viewport, selection, or disabled
-    for obj in bpy.data.objects:
-        obj.hide_set(False)
-        obj.hide_select = False
-        obj.hide_viewport = False
-
-    # select all the object and delete them (just like pressing A + X + D in the viewport)
-    bpy.ops.object.select_all(action="SELECT")
-    bpy.ops.object.delete()
+    # remove all the objects directly from the data (no need to unhide and select them first)
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
 
     # find all the collections and remove them
-    collection_names = [col.name for col in bpy.data.collections]
-    for name in collection_names:
-        bpy.data.collections.remove(bpy.data.collections[name])
+    for col in list(bpy.data.collections):
+        bpy.data.collections.remove(col)
 
     # in the case when you modify the world shader
     # delete and recreate the world object
-    world_names = [world.name for world in bpy.data.worlds]
-    for name in world_names:
-        bpy.data.worlds.remove(bpy.data.worlds[name])
+    for world in list(bpy.data.worlds):
+        bpy.data.worlds.remove(world)
     # create a new world data block
     bpy.ops.world.new()
     bpy.context.scene.world = bpy.data.worlds["World"]
@@ -78,17 +88,37 @@ def active_object():
     return bpy.context.active_object
 
 
-def time_seed():
+def _set_active(obj, view_layer=None):
+    """
+    Makes the given object the active and selected object.
+
+    Parameters:
+    - obj: The object to be made active.
+    - view_layer: The view layer to use. Pass it in when calling this in a loop
+      to avoid looking up bpy.context.view_layer on every call.
+    """
+    if view_layer is None:
+        view_layer = bpy.context.view_layer
+    view_layer.objects.active = obj
+    obj.select_set(True)
+
+
+def time_seed(quiet=False):
     """
     Sets the random seed based on the time
     and copies the seed into the clipboard
+
+    Parameters:
+    - quiet: Skip printing the seed and copying it into the clipboard.
     """
-    seed = time.time()
-    print(f"seed: {seed}")
+    seed = time.time_ns()
     random.seed(seed)
 
-    # add the seed value to your clipboard
-    bpy.context.window_manager.clipboard = str(seed)
+    if not quiet:
+        print(f"seed: {seed}")
+
+        # add the seed value to your clipboard
+        bpy.context.window_manager.clipboard = str(seed)
 
     return seed
 
@@ -104,26 +134,53 @@ def create_data_animation_loop(obj, data_path, start_value, mid_value, start_fra
     1. set the property to an initial value and add a keyframe in the beginning of the loop
     2. set the property to a middle value and add a keyframe in the middle of the loop
     3. set the property the initial value and add a keyframe at the end of the loop
-    """
-    # set the start value
-    setattr(obj, data_path, start_value)
-    # add a keyframe at the start
-    obj.keyframe_insert(data_path, frame=start_frame)
 
-    # set the middle value
-    setattr(obj, data_path, mid_value)
-    # add a keyframe in the middle
+    The three keyframes are written into the F-Curve in one go
+    instead of calling keyframe_insert() three times.
+    """
     mid_frame = start_frame + (loop_length) / 2
-    obj.keyframe_insert(data_path, frame=mid_frame)
+    end_frame = start_frame + loop_length
 
-    # set the end value
+    # the property ends the loop on the start value
     setattr(obj, data_path, start_value)
-    # add a keyframe in the end
-    end_frame = start_frame + loop_length
-    obj.keyframe_insert(data_path, frame=end_frame)
 
-    if linear_extrapolation:
-        set_fcurve_extrapolation_to_linear()
+    # the keyframes are stored in the action of the data block that owns the property (object, node tree, etc.)
+    id_data = obj.id_data
+    fcurve_data_path = obj.path_from_id(data_path)
+    animation_data = id_data.animation_data or id_data.animation_data_create()
+    if animation_data.action is None:
+        animation_data.action = bpy.data.actions.new(name=f"{id_data.name}Action")
+    fcurves = animation_data.action.fcurves
+
+    # array properties (like location) get one F-Curve per component
+    if obj.bl_rna.properties[data_path].is_array:
+        start_values, mid_values = tuple(start_value), tuple(mid_value)
+    else:
+        start_values, mid_values = (start_value,), (mid_value,)
+
+    frames = (start_frame, mid_frame, end_frame)
+
+    for index, (start, mid) in enumerate(zip(start_values, mid_values)):
+        fcurve = fcurves.find(fcurve_data_path, index=index) or fcurves.new(fcurve_data_path, index=index)
+        keyframe_points = fcurve.keyframe_points
+
+        # replace the keyframes that are already on these frames (just like keyframe_insert does)
+        # go backwards and look up each point by index, removing a point invalidates the ones after it
+        for i in range(len(keyframe_points) - 1, -1, -1):
+            if any(abs(keyframe_points[i].co[0] - frame) < 0.001 for frame in frames):
+                keyframe_points.remove(keyframe_points[i], fast=True)
+
+        keyframe_points.add(3)
+        co = [0.0] * (2 * len(keyframe_points))
+        keyframe_points.foreach_get("co", co)
+        co[-6:] = (start_frame, float(start), mid_frame, float(mid), end_frame, float(start))
+        keyframe_points.foreach_set("co", co)
+
+        if linear_extrapolation:
+            fcurve.extrapolation = "LINEAR"
+
+        # sort the keyframes and recalculate the handles once
+        fcurve.update()
 
 
 def set_scene_props(fps, frame_count):
@@ -134,9 +191,11 @@ def set_scene_props(fps, frame_count):
     scene.frame_end = frame_count
 
     # set the world background to black
-    world = bpy.data.worlds["World"]
-    if "Background" in world.node_tree.nodes:
-        world.node_tree.nodes["Background"].inputs[0].default_value = (0, 0, 0, 1)
+    world = scene.world
+    if world and world.node_tree:
+        background_node = world.node_tree.nodes.get("Background")
+        if background_node:
+            background_node.inputs[0].default_value = (0, 0, 0, 1)
 
     scene.render.fps = fps
 
@@ -144,7 +203,34 @@ def set_scene_props(fps, frame_count):
     scene.frame_start = 1
 
 
-def scene_setup():
+def is_scene_set_up(fps, frame_count):
+    """
+    Checks if the scene is empty and its properties match the ones set by set_scene_props()
+    """
+    # any leftover objects, meshes, materials, collections, node trees or animations mean the scene needs to be cleaned
+    leftover_data = (bpy.data.objects, bpy.data.meshes, bpy.data.materials, bpy.data.collections, bpy.data.node_groups, bpy.data.actions)
+    if any(len(data) for data in leftover_data):
+        return False
+
+    scene = bpy.context.scene
+    if (scene.frame_start, scene.frame_end, scene.frame_current, scene.render.fps) != (1, frame_count, 1, fps):
+        return False
+
+    world = scene.world
+    if not world or not world.node_tree:
+        return False
+    background_node = world.node_tree.nodes.get("Background")
+    return background_node is not None and tuple(background_node.inputs[0].default_value) == (0, 0, 0, 1)
+
+
+def scene_setup(skip_if_clean=False):
+    """
+    Seeds the random module, cleans the scene, and sets the scene properties.
+
+    Parameters:
+    - skip_if_clean: Skip cleaning the scene and setting the props
+      when the scene is already empty and set up (see is_scene_set_up()).
+    """
     fps = 30
     loop_seconds = 12
     frame_count = fps * loop_seconds
@@ -155,10 +241,14 @@ def scene_setup():
     else:
         time_seed()
 
+    if skip_if_clean and is_scene_set_up(fps, frame_count):
+        return
+
     clean_scene()
 
     set_scene_props(fps, frame_count)
 
+
 def create_node(node_tree, type_name):
     node_obj = node_tree.nodes.new(type=type_name)   
     return node_obj
@@ -187,22 +277,80 @@ def create_link(node_tree, from_node, output_socket_name, to_node, input_socket_
     - input_socket_name: The name of the input socket on the destination node.
     """
     node_tree.links.new(from_node.outputs[output_socket_name], to_node.inputs[input_socket_name])
-    
-    
+
+
+def make_linker(node_tree):
+    """
+    Returns a function that links two nodes in the given node tree, for building graphs with many links.
+    node_tree.links.new is looked up only once, instead of on every create_link() call.
+
+    Parameters:
+    - node_tree: The node tree in which the nodes reside.
+
+    Returns:
+    - A function link(from_node, output_socket_name, to_node, input_socket_name).
+    """
+    new_link = node_tree.links.new
+
+    def link(from_node, output_socket_name, to_node, input_socket_name):
+        return new_link(from_node.outputs[output_socket_name], to_node.inputs[input_socket_name])
+
+    return link
+
+# Usage (commented out for reference):
+# link = make_linker(node_tree)
+# link(subdivide_mesh_node, "Mesh", triangulate_node, "Mesh")
+
+
+def create_link_i(node_tree, from_node, output_socket_index, to_node, input_socket_index):
+    """
+    Create a link between two nodes using the index of the output and input sockets.
+    Indexing is faster than looking up sockets by name, use it for nodes with a fixed socket order
+    (see the socket indices next to NODE_TYPES).
+
+    Parameters:
+    - node_tree: The node tree in which the nodes reside.
+    - from_node: The source node from which the connection originates.
+    - output_socket_index: The index of the output socket on the source node.
+    - to_node: The destination node to which the connection leads.
+    - input_socket_index: The index of the input socket on the destination node.
+    """
+    node_tree.links.new(from_node.outputs[output_socket_index], to_node.inputs[input_socket_index])
+
+# Usage (commented out for reference):
+# create_link_i(node_tree, instance_on_points_node, 0, out_node, 0)  # Instances -> Geometry
+
+
 def add_geo_nodes_modifier(obj):
     """
-    Adds a Geometry Nodes modifier to the given object and sets it as the active object.
+    Adds a Geometry Nodes modifier with a new node tree to the given object.
+    The node tree gets a Geometry input and output socket and a linked
+    Group Input and Group Output node (just like the "New" button in the modifier panel).
 
     Parameters:
     - obj: The object to which the modifier should be added.
     """
-    # Ensure the object is selected and active
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
+    node_tree = bpy.data.node_groups.new(name="Geometry Nodes", type="GeometryNodeTree")
+
+    if bpy.app.version >= (4, 0, 0):
+        # run this only for Blender versions 4.0 and higher
+        node_tree.is_modifier = True
+        node_tree.interface.new_socket("Geometry", in_out="INPUT", socket_type="NodeSocketGeometry")
+        node_tree.interface.new_socket("Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry")
+    else:
+        # run this only for Blender versions lower than 4.0
+        node_tree.inputs.new("NodeSocketGeometry", "Geometry")
+        node_tree.outputs.new("NodeSocketGeometry", "Geometry")
+
+    in_node = node_tree.nodes.new(type="NodeGroupInput")
+    in_node.location.x = -200
+    out_node = node_tree.nodes.new(type="NodeGroupOutput")
+    out_node.location.x = 200
+    node_tree.links.new(in_node.outputs["Geometry"], out_node.inputs["Geometry"])
 
     # Add the Geometry Nodes modifier
-    bpy.ops.node.new_geometry_nodes_modifier()
-    node_tree = obj.modifiers["GeometryNodes"].node_group
+    modifier = obj.modifiers.new(name="GeometryNodes", type="NODES")
+    modifier.node_group = node_tree
     return node_tree
 
 def clear_nodes(node_tree):
@@ -212,8 +360,7 @@ def clear_nodes(node_tree):
     Parameters:
     - node_tree: The node tree from which nodes should be removed.
     """
-    for node in list(node_tree.nodes):  # Use list() to avoid issues during iteration
-        node_tree.nodes.remove(node)
+    node_tree.nodes.clear()
         
         
    
@@ -225,14 +372,35 @@ def create_mesh(mesh_type='PLANE', location=(0, 0, 0)):
     - mesh_type: Type of the mesh to be created ('PLANE', 'CUBE', 'SPHERE', etc.)
     - location: Location where the mesh should be created
     """
+    if mesh_type not in {'PLANE', 'CUBE', 'SPHERE'}:
+        raise ValueError(f"Unsupported mesh type: {mesh_type}. Supported mesh types are PLANE, CUBE, and SPHERE.")
+
+    name = mesh_type.title()
+    mesh = bpy.data.meshes.new(name)
+
+    # build the mesh data directly with bmesh instead of calling the primitive operators
+    bm = bmesh.new()
+    # add a UV map, just like the primitive operators do by default
+    bm.loops.layers.uv.new("UVMap")
     if mesh_type == 'PLANE':
-        bpy.ops.mesh.primitive_plane_add(location=location)
+        bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=1.0, calc_uvs=True)
     elif mesh_type == 'CUBE':
-        bpy.ops.mesh.primitive_cube_add(location=location)
+        bmesh.ops.create_cube(bm, size=2.0, calc_uvs=True)
     elif mesh_type == 'SPHERE':
-        bpy.ops.mesh.primitive_uv_sphere_add(location=location)
+        if bpy.app.version >= (3, 0, 0):
+            # run this only for Blender versions 3.0 and higher
+            bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=1.0, calc_uvs=True)
+        else:
+            # run this only for Blender versions lower than 3.0 (the radius was called diameter)
+            bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, diameter=1.0, calc_uvs=True)
     # ... Add more mesh types as needed
-    return active_object()
+    bm.to_mesh(mesh)
+    bm.free()
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    return obj
 
 # Usage:
 # plane = create_mesh('PLANE', location=(0, 0, 0))
@@ -247,7 +415,10 @@ def move_object(obj, translation_vector=(0, 0, 0)):
     - obj: The object to be moved.
     - translation_vector: A tuple (dx, dy, dz) specifying the translation in each axis.
     """
-    obj.location += bpy.Vector(translation_vector)
+    location = obj.location
+    location[0] += translation_vector[0]
+    location[1] += translation_vector[1]
+    location[2] += translation_vector[2]
     
 # Usage (commented out for reference):
 # move_object(my_object, (1, 0, 0))  # Move the object 1 unit in the x-axis
@@ -261,7 +432,10 @@ def scale_object(obj, scale_factor=(1, 1, 1)):
     - obj: The object to be scaled.
     - scale_factor: A tuple (sx, sy, sz) specifying the scaling in each axis.
     """
-    obj.scale *= bpy.Vector(scale_factor)
+    scale = obj.scale
+    scale[0] *= scale_factor[0]
+    scale[1] *= scale_factor[1]
+    scale[2] *= scale_factor[2]
 
 # Usage (commented out for reference):
 # scale_object(my_object, (2, 2, 2))  # Double the object's size in all axes
@@ -274,9 +448,12 @@ def enter_edit_mode(obj):
     Parameters:
     - obj: The object to be switched to edit mode.
     """
+    # Nothing to do if the object is already in edit mode
+    if obj.mode == 'EDIT':
+        return
+
     # Ensure the object is selected
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
+    _set_active(obj)
 
     # Switch to edit mode
     bpy.ops.object.mode_set(mode='EDIT')
@@ -291,9 +468,12 @@ def exit_edit_mode(obj):
     Parameters:
     - obj: The object to be switched back to object mode.
     """
+    # Nothing to do if the object is already in object mode
+    if obj.mode == 'OBJECT':
+        return
+
     # Ensure the object is selected
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
+    _set_active(obj)
 
     # Switch to object mode
     bpy.ops.object.mode_set(mode='OBJECT')
@@ -314,15 +494,12 @@ def set_selection_mode(obj, mode='FACE'):
     if obj.mode != 'EDIT':
         enter_edit_mode(obj)
     
-    # Set the selection mode
-    if mode == 'VERTEX':
-        bpy.ops.mesh.select_mode(type='VERT')
-    elif mode == 'EDGE':
-        bpy.ops.mesh.select_mode(type='EDGE')
-    elif mode == 'FACE':
-        bpy.ops.mesh.select_mode(type='FACE')
-    else:
+    if mode not in {'VERTEX', 'EDGE', 'FACE'}:
         print(f"Unsupported mode: {mode}. Supported modes are VERTEX, EDGE, and FACE.")
+        return
+
+    # Set the selection mode directly on the tool settings (no bpy.ops.mesh.select_mode call needed)
+    bpy.context.tool_settings.mesh_select_mode = (mode == 'VERTEX', mode == 'EDGE', mode == 'FACE')
 
 # Usage (commented out for reference):
 # set_selection_mode(my_object, mode='FACE')  # Set the object's selection mode to face selection
@@ -334,47 +511,173 @@ def duplicate_mesh(obj):
     Parameters:
     - obj: The mesh object to be duplicated.
     """
-    # Ensure the object is selected and active
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    
-    # Duplicate the object
-    bpy.ops.object.duplicate_move()
-    
-    # The duplicated object will be the active object after the operation
-    duplicate_obj = bpy.context.active_object
-    
+    # Copy the object and its mesh data (the copy keeps the same animation action)
+    duplicate_obj = obj.copy()
+    if obj.data:
+        duplicate_obj.data = obj.data.copy()
+
+    # Link the duplicate into the same collections as the original object
+    collections = obj.users_collection or (bpy.context.collection,)
+    for collection in collections:
+        collection.objects.link(duplicate_obj)
+
     return duplicate_obj
 
 
-def duplicate_node(node_tree, node):
+# node properties that duplicate_node() sets itself or that must stay unique per node
+# ("location_absolute" is only a different view of "location", which is set after the parent,
+# "is_active_output" would take the active output flag away from the original Group Output node,
+# "active_item" and "active_index" point at items of the original node, like the bake or repeat items)
+_NODE_PROPS_NOT_TO_COPY = frozenset(
+    ("name", "location", "location_absolute", "select", "is_active_output", "active_item", "active_index")
+)
+
+# node properties that change which values the other properties accept (like the operations of a Compare node),
+# so they are copied before the rest
+_NODE_PROPS_TO_COPY_FIRST = ("data_type", "input_type", "domain", "mode")
+
+
+def _copy_rna_properties(source, target, skip=frozenset(), first=()):
+    """
+    Copies all the writable properties of a Blender data struct onto another struct of the same type.
+
+    Parameters:
+    - source: The struct to copy the properties from.
+    - target: The struct to copy the properties to.
+    - skip: The identifiers of the properties that should not be copied.
+    - first: The identifiers of the properties that should be copied before the others.
+    """
+    identifiers = [
+        prop.identifier
+        for prop in source.bl_rna.properties
+        if not prop.is_readonly and prop.identifier not in skip and not prop.identifier.startswith("bl_")
+    ]
+    identifiers = [identifier for identifier in first if identifier in identifiers] + [
+        identifier for identifier in identifiers if identifier not in first
+    ]
+
+    failed_identifiers = []
+    for identifier in identifiers:
+        try:
+            setattr(target, identifier, getattr(source, identifier))
+        except (TypeError, ValueError):
+            failed_identifiers.append(identifier)
+
+    # some values are only accepted once the properties they depend on are copied, try these once more
+    for identifier in failed_identifiers:
+        setattr(target, identifier, getattr(source, identifier))
+
+
+def _copy_color_ramp(source, target):
+    """
+    Copies the settings and all the elements (stops) of a color ramp onto another color ramp.
+    """
+    _copy_rna_properties(source, target)
+
+    # a color ramp always keeps at least one element
+    elements = target.elements
+    while len(elements) > 1:
+        elements.remove(elements[-1])
+
+    elements[0].position = source.elements[0].position
+    elements[0].color = source.elements[0].color
+    for source_element in source.elements[1:]:
+        element = elements.new(source_element.position)
+        element.color = source_element.color
+
+
+def _copy_curve_mapping(source, target):
+    """
+    Copies the settings and all the curve points of a curve mapping (Float/Vector/RGB Curves) onto another one.
+    """
+    _copy_rna_properties(source, target)
+
+    for curve, source_curve in zip(target.curves, source.curves):
+        # a curve always keeps at least two points
+        points = curve.points
+        while len(points) > 2:
+            points.remove(points[-1])
+
+        for point, source_point in zip(points, source_curve.points):
+            point.location = source_point.location
+        for source_point in source_curve.points[2:]:
+            points.new(*source_point.location)
+
+        for point, source_point in zip(points, source_curve.points):
+            point.handle_type = source_point.handle_type
+
+    target.update()
+
+
+def duplicate_node(node_tree, node, offset=(20, -20)):
     """
     Duplicates a node within a node tree and returns the duplicate.
+    The node is copied directly in the node tree data, so no Node Editor is needed.
 
     Parameters:
     - node_tree: The node tree in which the node resides.
     - node: The node to be duplicated.
-    """
-    # Ensure the node tree is active
-    bpy.context.space_data.node_tree = node_tree
-    
-    # Make sure only the desired node is selected
-    for n in node_tree.nodes:
-        n.select = False
-    node.select = True
-    node_tree.nodes.active = node
-    
-    # Duplicate the node
-    bpy.ops.node.duplicate()
-    
-    # The duplicated node will be the active node after the operation
-    duplicate_node = node_tree.nodes.active
-    
+    - offset: A tuple (dx, dy) specifying where to place the duplicate relative to the node.
+    """
+    duplicate_node = node_tree.nodes.new(type=node.bl_idname)
+
+    try:
+        # copy the node settings first, some of them (like data_type) change the available sockets
+        _copy_rna_properties(node, duplicate_node, skip=_NODE_PROPS_NOT_TO_COPY, first=_NODE_PROPS_TO_COPY_FIRST)
+
+        # color ramps and curves are read-only pointers, but their content can be edited and needs to be copied
+        for prop in node.bl_rna.properties:
+            if prop.type != "POINTER" or not prop.is_readonly:
+                continue
+            if prop.fixed_type.identifier == "ColorRamp":
+                _copy_color_ramp(getattr(node, prop.identifier), getattr(duplicate_node, prop.identifier))
+            elif prop.fixed_type.identifier == "CurveMapping":
+                _copy_curve_mapping(getattr(node, prop.identifier), getattr(duplicate_node, prop.identifier))
+
+        # set the location after the parent (frame) was copied, the location is relative to the parent
+        duplicate_node.location = node.location + mathutils.Vector(offset)
+
+        for sockets, duplicate_sockets in ((node.inputs, duplicate_node.inputs), (node.outputs, duplicate_node.outputs)):
+            for socket, duplicate_socket in zip(sockets, duplicate_sockets):
+                if hasattr(socket, "default_value"):
+                    duplicate_socket.default_value = socket.default_value
+    except Exception:
+        # don't leave a half copied node behind in the node tree
+        node_tree.nodes.remove(duplicate_node)
+        raise
+
+    # Make sure only the duplicated node is selected (deselect all the nodes in one call)
+    node_tree.nodes.foreach_set("select", [False] * len(node_tree.nodes))
+    duplicate_node.select = True
+    node_tree.nodes.active = duplicate_node
+
     return duplicate_node
 
+
+# socket names looked up by get_socket_names(), keyed by the node bl_idname
+_socket_cache = {}
+
+# nodes with a fixed socket layout (see the socket indices next to NODE_TYPES),
+# only these are cached, any other node type (groups, zones, custom nodes, etc.) is always looked up
+_FIXED_SOCKET_NODE_TYPES = frozenset(
+    (
+        "GeometryNodeInstanceOnPoints",
+        "GeometryNodeDistributePointsOnFaces",
+        "GeometryNodeSubdivideMesh",
+        "GeometryNodeMeshCube",
+        "GeometryNodeTriangulate",
+        "GeometryNodeSplitEdges",
+        "GeometryNodeSeparateGeometry",
+        "GeometryNodeScaleElements",
+        "GeometryNodeJoinGeometry",
+    )
+)
+
+
 def get_socket_names(node):
     """
     Returns the names of input and output sockets (pins) of a node.
+    The names are cached per node type for the nodes with a fixed socket layout.
 
     Parameters:
     - node: The node whose socket names are to be retrieved.
@@ -382,13 +685,25 @@ def get_socket_names(node):
     Returns:
     - A dictionary with 'inputs' and 'outputs' keys.
     """
+    key = node.bl_idname
+    cached = _socket_cache.get(key)
+    if cached is None:
+        cached = (
+            tuple(socket.name for socket in node.inputs),
+            tuple(socket.name for socket in node.outputs),
+        )
+        if key in _FIXED_SOCKET_NODE_TYPES:
+            _socket_cache[key] = cached
+
+    # return new lists every time, so the caller can't change the cached names
     socket_info = {
-        'inputs': [socket.name for socket in node.inputs],
-        'outputs': [socket.name for socket in node.outputs]
+        'inputs': list(cached[0]),
+        'outputs': list(cached[1])
     }
-    
+
     return socket_info
 
+
 def get_active_geo_nodes_viewport_area():
     """
     Returns the active VIEW_3D area in the Geometry Nodes tab if Blender is in Object Mode.
@@ -401,15 +716,13 @@ def get_active_geo_nodes_viewport_area():
         return None
 
     # Check if we're in the Geometry Nodes tab
-    if bpy.context.screen.name != 'Geometry Nodes':
+    screen = bpy.context.screen
+    if screen.name != 'Geometry Nodes':
         print("Not in the Geometry Nodes tab!")
         return None
 
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            return area
+    return next((area for area in screen.areas if area.type == 'VIEW_3D'), None)
 
-    return None
 
 def set_active_3d_view_to_wireframe():
     """
@@ -425,43 +738,130 @@ def set_active_3d_view_to_wireframe():
         print("No active 3D Viewport found in the Geometry Nodes workspace.")
 
 
+@njit(cache=NUMBA_CACHE, fastmath=True)
+def _displace_along_normals(coords, normals, amplitude, phases):
+    """
+    Moves every vertex along its normal by amplitude * sin(phase).
+    Only numpy code in here (no bpy calls), so numba can compile it.
+
+    Parameters:
+    - coords: A (N, 3) float32 array of vertex coordinates, updated in place.
+    - normals: A (N, 3) float32 array of vertex normals.
+    - amplitude: The maximum distance a vertex is moved.
+    - phases: A (N,) float32 array with the phase of each vertex.
+    """
+    offsets = amplitude * np.sin(phases)
+    for axis in range(3):
+        coords[:, axis] += normals[:, axis] * offsets
+    return coords
+
+
+def get_vertex_coordinates(mesh):
+    """
+    Returns the coordinates of all the vertices of a mesh as a (N, 3) float32 array,
+    read in one foreach_get call instead of a Python loop over mesh.vertices.
+    """
+    vertex_count = len(mesh.vertices)
+    buffer = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", buffer)
+    return buffer.reshape(vertex_count, 3)
+
+
+def get_vertex_normals(mesh):
+    """
+    Returns the normals of all the vertices of a mesh as a (N, 3) float32 array.
+    """
+    vertex_count = len(mesh.vertices)
+    buffer = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("normal", buffer)
+    return buffer.reshape(vertex_count, 3)
+
+
+def set_vertex_coordinates(mesh, coords):
+    """
+    Writes a (N, 3) array of coordinates back into the vertices of a mesh in one foreach_set call.
+    """
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+    mesh.update()
+
+
+def displace_vertices_along_normals(obj, amplitude, phases):
+    """
+    Moves every vertex of a mesh object along its normal by amplitude * sin(phase).
+
+    Parameters:
+    - obj: The mesh object whose vertices should be moved.
+    - amplitude: The maximum distance a vertex is moved.
+    - phases: A single phase for all the vertices or one phase per vertex.
+    """
+    mesh = obj.data
+    coords = get_vertex_coordinates(mesh)
+    normals = get_vertex_normals(mesh)
+
+    if np.isscalar(phases):
+        phases = np.full(len(coords), phases, dtype=np.float32)
+    else:
+        phases = np.ascontiguousarray(phases, dtype=np.float32)
+
+    _displace_along_normals(coords, normals, amplitude, phases)
+    set_vertex_coordinates(mesh, coords)
+
+# Usage (commented out for reference):
+# displace_vertices_along_normals(my_object, amplitude=0.1, phases=1.5708)  # Push all the vertices out by 0.1
+
+
 ################################################################
 # helper functions END
 ################################################################
-nodeList = {
-    "GeometryNodeInstanceOnPoints",
-    "NodeGroupInput",
-    "NodeGroupOutput",
-    "GeometryNodeDistributePointsOnFaces",
-    "GeometryNodePointScale",
-    "GeometryNodeAttributeTransfer",
-    "GeometryNodeVectorMath",
-    "GeometryNodeAttributeMath",
-    "GeometryNodeAttributeProximity",
-    "GeometryNodePointSeparate",
-    "GeometryNodePointCombine",
-    "GeometryNodeAttributeCombine",
-    "GeometryNodeAttributeFill",
-    "GeometryNodeAttributeRandomize",
-    "GeometryNodeAttributeCurve",
-    "GeometryNodeAttributeColorRamp",
-    "GeometryNodeAttributeClamp",
-    "GeometryNodeAttributeMix",
-    "GeometryNodePointTranslate",
-    "GeometryNodePointRotate",
-    "GeometryNodePointScale",
-    "GeometryNodeAttributeNormal",
-    "GeometryNodeAttributeTangent",
-    "GeometryNodeAttributeUVMap",
-    "GeometryNodeAttributePosition",
-    "GeometryNodeAttributeBounds",
-    "GeometryNodeAttributeProximity",
-    "GeometryNodePointInstance",
-    "GeometryNodeMeshPrimitive",
-    "GeometryNodeAttributeBoolean",
-    "GeometryNodeSubdivideMesh",
-    # Add more nodes as needed
-}
+NODE_TYPES = frozenset(
+    (
+        "GeometryNodeInstanceOnPoints",
+        "NodeGroupInput",
+        "NodeGroupOutput",
+        "GeometryNodeDistributePointsOnFaces",
+        "GeometryNodePointScale",
+        "GeometryNodeAttributeTransfer",
+        "GeometryNodeVectorMath",
+        "GeometryNodeAttributeMath",
+        "GeometryNodeAttributeProximity",
+        "GeometryNodePointSeparate",
+        "GeometryNodePointCombine",
+        "GeometryNodeAttributeCombine",
+        "GeometryNodeAttributeFill",
+        "GeometryNodeAttributeRandomize",
+        "GeometryNodeAttributeCurve",
+        "GeometryNodeAttributeColorRamp",
+        "GeometryNodeAttributeClamp",
+        "GeometryNodeAttributeMix",
+        "GeometryNodePointTranslate",
+        "GeometryNodePointRotate",
+        "GeometryNodeAttributeNormal",
+        "GeometryNodeAttributeTangent",
+        "GeometryNodeAttributeUVMap",
+        "GeometryNodeAttributePosition",
+        "GeometryNodeAttributeBounds",
+        "GeometryNodePointInstance",
+        "GeometryNodeMeshPrimitive",
+        "GeometryNodeAttributeBoolean",
+        "GeometryNodeSubdivideMesh",
+        # Add more nodes as needed
+    )
+)
+
+# socket indices for create_link_i() of the nodes above that have a fixed socket order
+#
+# GeometryNodeInstanceOnPoints
+#   inputs: Points=0, Selection=1, Instance=2, Pick Instance=3, Instance Index=4, Rotation=5, Scale=6
+#   outputs: Instances=0
+# GeometryNodeDistributePointsOnFaces
+#   inputs: Mesh=0, Selection=1
+#   outputs: Points=0, Normal=1, Rotation=2
+# GeometryNodeSubdivideMesh
+#   inputs: Mesh=0, Level=1
+#   outputs: Mesh=0
+# NodeGroupInput / NodeGroupOutput (node tree made by add_geo_nodes_modifier())
+#   Group Input outputs: Geometry=0
+#   Group Output inputs: Geometry=0
 
 
 ################################################################